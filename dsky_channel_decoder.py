@@ -4,28 +4,31 @@ DSKY Channel Decoder
 Decodes AGC output channels (especially Channel 10) into display state
 """
 
-from dsky_display import DisplayState
+from dsky_display import DisplayState, BLANK, PROG, VERB, NOUN, R1, R2, R3, SIGNS
 
 
 # 7-segment encoding lookup table
-# Maps 5-bit patterns to digits 0-9
-# Based on standard 7-segment encoding used by AGC
+# Maps the 5-bit relay codes sent on Channel 10 to digits 0-9
+# (Virtual AGC developer documentation, Channel 10 "DSKY digit" codes)
 SEVEN_SEGMENT_TO_DIGIT = {
-    0b11111: 0,  # All segments except middle
-    0b00110: 1,  # Right segments only
-    0b11011: 2,  # Top, middle, bottom, etc.
-    0b01111: 3,
-    0b00110: 4,
-    0b01101: 5,
-    0b11101: 6,
-    0b00111: 7,
-    0b11111: 8,
-    0b01111: 9,
-    0b00000: None,  # Blank
+    0b10101: 0,
+    0b00011: 1,
+    0b11001: 2,
+    0b11011: 3,
+    0b01111: 4,
+    0b11110: 5,
+    0b11100: 6,
+    0b10011: 7,
+    0b11101: 8,
+    0b11111: 9,
 }
 
-# Alternative: Direct mapping if AGC sends digit values directly
-# We'll try both approaches
+# Inverse mapping, used to encode test values
+DIGIT_TO_SEVEN_SEGMENT = {digit: bits for bits, digit in SEVEN_SEGMENT_TO_DIGIT.items()}
+
+# Precomputed digit for every possible 5-bit pattern
+# Relay code 0b00000, or any code that isn't a valid digit, is BLANK
+_SEG_LUT = bytes(SEVEN_SEGMENT_TO_DIGIT.get(bits, BLANK) for bits in range(32))
 
 
 def seven_segment_to_digit(bits: int) -> int:
@@ -36,34 +39,45 @@ def seven_segment_to_digit(bits: int) -> int:
         bits: 5-bit pattern representing 7-segment encoding
 
     Returns:
-        Digit 0-9, or None if blank
-
-    Note: The AGC may send digits directly (0-9) rather than
-          7-segment bit patterns. We'll handle both cases.
+        Digit 0-9, or BLANK (0xFF) if blank
     """
-    # Try direct interpretation first (if bits are 0-9)
-    if 0 <= bits <= 9:
-        return bits
-
-    # Try lookup table for 7-segment encoding
-    if bits in SEVEN_SEGMENT_TO_DIGIT:
-        return SEVEN_SEGMENT_TO_DIGIT[bits]
-
-    # For values 10-31, map to octal interpretation
-    # AGC uses octal, so value might be in octal format
-    try:
-        octal_str = oct(bits)[2:]  # Convert to octal string
-        if len(octal_str) == 2 and octal_str[0] == '0':
-            digit = int(octal_str[1])
-            if 0 <= digit <= 9:
-                return digit
-        elif len(octal_str) == 1:
-            return int(octal_str)
-    except:
-        pass
-
-    # Default to showing the value modulo 10
-    return bits % 10
+    return _SEG_LUT[bits]
+
+
+def _digit_pair(bits: int) -> bytes:
+    """Decode the 10 digit bits (CCCCCDDDDD) of a Channel 10 word"""
+    return bytes((_SEG_LUT[bits >> 5], _SEG_LUT[bits & 0b11111]))
+
+
+# Precomputed 2-byte (d1, d2) for every possible 10-bit digit field, so
+# decode_channel10 converts and stores both digits with one lookup and
+# one slice assignment
+_PAIR_LUT = tuple(_digit_pair(bits) for bits in range(1024))
+
+
+# Channel 10 relay table, indexed by the 4-bit relay code (0-15)
+# Each entry is (offset of the first digit in DisplayState.buffer,
+# offset of the sign set from bit 10 or None). Both digits are written
+# to consecutive offsets (relay 3 spans R2/R3, which are adjacent).
+# None entries are ignored (relay 12 indicator lamps are Phase 2).
+_RELAY_TABLE = (
+    None,                             # 0: unused
+    (R3.start + 3, None),             # 1: R3 digits 4-5
+    (R3.start + 1, SIGNS.start + 2),  # 2: R3 digits 2-3 (with sign)
+    (R2.start + 4, None),             # 3: R2 digit 5, R3 digit 1
+    (R2.start + 2, None),             # 4: R2 digits 3-4
+    (R2.start, SIGNS.start + 1),      # 5: R2 digits 1-2 (with sign)
+    (R1.start + 3, None),             # 6: R1 digits 4-5
+    (R1.start + 2, SIGNS.start),      # 7: R1 digits 2-3 (with sign)
+    (R1.start, None),                 # 8: R1 digits 1-2
+    (NOUN.start, None),               # 9: NOUN (N1, N2)
+    (VERB.start, None),               # 10: VERB (V1, V2)
+    (PROG.start, None),               # 11: PROG (M1, M2)
+    None,                             # 12: Indicator lamps (Phase 2)
+    None,                             # 13: unused
+    None,                             # 14: unused
+    None,                             # 15: unused
+)
 
 
 def decode_channel10(value: int, display_state: DisplayState):
@@ -73,8 +87,8 @@ def decode_channel10(value: int, display_state: DisplayState):
     Format: AAAABCCCCCDDDDD
     - AAAA (bits 11-14): Relay code (identifies which digit pair)
     - B (bit 10): Sign bit for registers
-    - CCCCC (bits 5-9): First digit (7-segment encoding or direct)
-    - DDDDD (bits 0-4): Second digit (7-segment encoding or direct)
+    - CCCCC (bits 5-9): First digit (7-segment relay code)
+    - DDDDD (bits 0-4): Second digit (7-segment relay code)
 
     Relay Codes:
       11 (0xB): PROG (M1, M2)
@@ -95,74 +109,20 @@ def decode_channel10(value: int, display_state: DisplayState):
         display_state: DisplayState object to update
     """
     # Extract bit fields
-    relay = (value >> 11) & 0b1111        # Bits 11-14
-    sign_bit = (value >> 10) & 0b1       # Bit 10
-    digit1_bits = (value >> 5) & 0b11111 # Bits 5-9
-    digit2_bits = value & 0b11111          # Bits 0-4
-
-    # Convert to digits
-    d1 = seven_segment_to_digit(digit1_bits)
-    d2 = seven_segment_to_digit(digit2_bits)
-
-    # Update display based on relay code
-    if relay == 11:  # PROG (M1, M2)
-        display_state.set_prog(d1 or 0, d2 or 0)
-
-    elif relay == 10:  # VERB (V1, V2)
-        display_state.set_verb(d1 or 0, d2 or 0)
-
-    elif relay == 9:  # NOUN (N1, N2)
-        display_state.set_noun(d1 or 0, d2 or 0)
-
-    elif relay == 8:  # R1 digits 1-2
-        with display_state.lock:
-            display_state.r1[0] = d1 or 0
-            display_state.r1[1] = d2 or 0
-
-    elif relay == 7:  # R1 digits 2-3 with sign
-        with display_state.lock:
-            display_state.r1[2] = d1 or 0
-            display_state.r1[3] = d2 or 0
-            # Sign: 0 = +, 1 = -
-            display_state.r1_sign = '-' if sign_bit else '+'
-
-    elif relay == 6:  # R1 digits 4-5
-        with display_state.lock:
-            display_state.r1[3] = d1 or 0
-            display_state.r1[4] = d2 or 0
-
-    elif relay == 5:  # R2 digits 1-2 with sign
-        with display_state.lock:
-            display_state.r2[0] = d1 or 0
-            display_state.r2[1] = d2 or 0
-            # Sign: 0 = +, 1 = -
-            display_state.r2_sign = '-' if sign_bit else '+'
-
-    elif relay == 4:  # R2 digits 3-4
-        with display_state.lock:
-            display_state.r2[2] = d1 or 0
-            display_state.r2[3] = d2 or 0
-
-    elif relay == 3:  # R2 digit 5, R3 digit 1
-        with display_state.lock:
-            display_state.r2[4] = d1 or 0
-            display_state.r3[0] = d2 or 0
-
-    elif relay == 2:  # R3 digits 2-3 with sign
-        with display_state.lock:
-            display_state.r3[1] = d1 or 0
-            display_state.r3[2] = d2 or 0
-            # Sign: 0 = +, 1 = -
-            display_state.r3_sign = '-' if sign_bit else '+'
-
-    elif relay == 1:  # R3 digits 4-5
-        with display_state.lock:
-            display_state.r3[3] = d1 or 0
-            display_state.r3[4] = d2 or 0
-
-    elif relay == 12:  # Indicator lamps (Phase 2)
-        # Ignore for Phase 1 - will be implemented with LED control
-        pass
+    entry = _RELAY_TABLE[(value >> 11) & 0b1111]   # Bits 11-14
+    if entry is None:
+        return
+    offset, sign_offset = entry
+
+    # Bits 0-9 decode to both digits in one lookup
+    pair = _PAIR_LUT[value & 0b1111111111]
+
+    buffer = display_state.buffer
+    buffer[offset:offset + 2] = pair
+    if sign_offset is not None:
+        # Sign (bit 10): 0 = + (SIGN_PLUS), 1 = - (SIGN_MINUS)
+        buffer[sign_offset] = (value >> 10) & 0b1
+    display_state.mark_changed()
 
 
 def decode_channel11(value: int, display_state: DisplayState):
@@ -180,8 +140,7 @@ def decode_channel11(value: int, display_state: DisplayState):
     # COMP ACTY is bit 1 (may need verification)
     comp_acty = (value >> 1) & 0b1
 
-    with display_state.lock:
-        display_state.comp_acty = bool(comp_acty)
+    display_state.set_comp_acty(bool(comp_acty))
 
 
 def decode_channel13(value: int, display_state: DisplayState):
@@ -203,38 +162,39 @@ if __name__ == '__main__':
     from dsky_display import DisplayState
 
     state = DisplayState()
+    seg = DIGIT_TO_SEVEN_SEGMENT
 
     # Test PROG = 16
     print("Testing PROG = 16")
     # Relay 11, digit1 = 1, digit2 = 6
-    value = (11 << 11) | (1 << 5) | 6
+    value = (11 << 11) | (seg[1] << 5) | seg[6]
     decode_channel10(value, state)
-    print(f"  PROG: {state.prog}")
+    print(f"  PROG: {list(state.prog)}")
 
     # Test VERB = 37
     print("Testing VERB = 37")
-    value = (10 << 11) | (3 << 5) | 7
+    value = (10 << 11) | (seg[3] << 5) | seg[7]
     decode_channel10(value, state)
-    print(f"  VERB: {state.verb}")
+    print(f"  VERB: {list(state.verb)}")
 
     # Test NOUN = 06
     print("Testing NOUN = 06")
-    value = (9 << 11) | (0 << 5) | 6
+    value = (9 << 11) | (seg[0] << 5) | seg[6]
     decode_channel10(value, state)
-    print(f"  NOUN: {state.noun}")
+    print(f"  NOUN: {list(state.noun)}")
 
     # Test R1 with sign
     print("Testing R1 = +12345")
     # R1 digits 1-2
-    value = (8 << 11) | (1 << 5) | 2
+    value = (8 << 11) | (seg[1] << 5) | seg[2]
     decode_channel10(value, state)
     # R1 digits 2-3 with + sign
-    value = (7 << 11) | (0 << 10) | (3 << 5) | 4
+    value = (7 << 11) | (0 << 10) | (seg[3] << 5) | seg[4]
     decode_channel10(value, state)
     # R1 digits 4-5
-    value = (6 << 11) | (4 << 5) | 5
+    value = (6 << 11) | (seg[4] << 5) | seg[5]
     decode_channel10(value, state)
-    print(f"  R1: {state.r1}, sign: {state.r1_sign}")
+    print(f"  R1: {list(state.r1)}, sign: {'+-'[state.signs[0]]}")
 
     # Test COMP ACTY
     print("Testing COMP ACTY = ON")
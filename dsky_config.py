@@ -7,48 +7,54 @@ Handles loading and validation of YAML configuration file
 import yaml
 import os
 import sys
-from typing import Any, Dict
+import json
+import keyword
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, NamedTuple, Optional
 
 
-class Config:
-    """Immutable configuration object"""
-
-    def __init__(self, config_dict: Dict[str, Any]):
-        self._config = config_dict
-
-    def __getattr__(self, name):
-        if name.startswith('_'):
-            return object.__getattribute__(self, name)
-        return ConfigSection(self._config.get(name, {}))
-
-
-class ConfigSection:
-    """Configuration section with dot notation access"""
-
-    def __init__(self, section_dict: Dict[str, Any]):
-        self._section = section_dict
+def _freeze(name: str, value: Any) -> Any:
+    """
+    Recursively convert a configuration dict into nested namedtuples
 
-    def __getattr__(self, name):
-        if name.startswith('_'):
-            return object.__getattribute__(self, name)
-        value = self._section.get(name)
-        if isinstance(value, dict):
-            return ConfigSection(value)
+    Sections become immutable namedtuples (attribute access is a C-level
+    slot read). Dicts whose keys aren't all identifiers, such as index
+    mappings, are kept as read-only mappings.
+    """
+    if not isinstance(value, dict):
         return value
+    frozen = {key: _freeze(key if _is_field_name(key) else 'Section', item)
+              for key, item in value.items()}
+    if all(_is_field_name(key) for key in value):
+        return namedtuple(name, frozen.keys())(**frozen)
+    return MappingProxyType(frozen)
+
 
-    def get(self, name, default=None):
-        return self._section.get(name, default)
+def _is_field_name(key: Any) -> bool:
+    """Check if a config key can be used as a namedtuple type or field name"""
+    return (isinstance(key, str) and key.isidentifier() and not keyword.iskeyword(key)
+            and not key.startswith('_'))
 
 
-def load_config(config_path: str) -> Config:
+def load_config(config_path: str, overrides: Optional[Dict[str, Any]] = None) -> NamedTuple:
     """
     Load and validate YAML configuration file
 
+    The YAML settings with defaults applied are cached as JSON next to
+    the YAML file (config_path + '.cache') and reused until the YAML
+    file or this module is modified. The cache is only written once the
+    configuration has passed validation, which still runs on every load.
+
     Args:
         config_path: Path to configuration YAML file
+        overrides: Optional nested dict merged over the loaded settings
+                   (e.g. command-line options)
 
     Returns:
-        Config object with validated settings
+        Immutable nested namedtuple with validated settings
+        (e.g. config.display.resolution.width)
 
     Raises:
         FileNotFoundError: If config file doesn't exist
@@ -58,16 +64,60 @@ def load_config(config_path: str) -> Config:
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, 'r') as f:
-        config_dict = yaml.safe_load(f)
+    cache_path = config_path + '.cache'
+    loaded = _load_cache(config_path, cache_path)
+    cached = loaded is not None
+
+    if not cached:
+        with open(config_path, 'r') as f:
+            loaded = yaml.safe_load(f)
+
+        # Apply defaults
+        loaded = apply_defaults(loaded)
 
-    # Apply defaults
-    config_dict = apply_defaults(config_dict)
+    config_dict = deep_merge(loaded, overrides) if overrides else loaded
 
     # Validate configuration
     validate_config(config_dict)
 
-    return Config(config_dict)
+    if not cached:
+        _save_cache(cache_path, loaded)
+
+    return _freeze('Config', config_dict)
+
+
+def _load_cache(config_path: str, cache_path: str) -> Optional[Dict[str, Any]]:
+    """Return the cached configuration, or None if missing or stale"""
+    try:
+        cache_mtime = os.path.getmtime(cache_path)
+        if cache_mtime < max(os.path.getmtime(config_path), os.path.getmtime(__file__)):
+            return None
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _save_cache(cache_path: str, config_dict: Dict[str, Any]) -> None:
+    """
+    Write the configuration cache (failures are not fatal)
+
+    Settings that don't survive a JSON round trip unchanged (e.g. non-string
+    keys or YAML dates) are not cached, so the cache always reloads exactly
+    what the YAML file gives.
+    """
+    try:
+        data = json.dumps(config_dict)
+        if json.loads(data) != config_dict:
+            return
+    except (TypeError, ValueError):
+        return
+    try:
+        with open(cache_path, 'w') as f:
+            f.write(data)
+    except OSError as e:
+        print(f"Warning: Could not write config cache {cache_path}: {e}", file=sys.stderr)
 
 
 def apply_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
@@ -183,10 +233,11 @@ def validate_config(config: Dict[str, Any]) -> None:
         raise ValueError(f"Invalid window_mode: {window_mode}. Must be 'windowed' or 'fullscreen'")
 
 
+@lru_cache(maxsize=16)
 def hex_to_rgb(hex_color: str) -> tuple:
     """Convert hex color string to RGB tuple"""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    value = int(hex_color.lstrip('#'), 16)
+    return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
 
 
 if __name__ == '__main__':
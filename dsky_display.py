@@ -9,79 +9,201 @@ import time
 import sys
 import os
 import threading
-from dsky_config import Config, hex_to_rgb
+from collections import namedtuple
+from dsky_config import hex_to_rgb
+
+
+# Display buffer layout
+# All display digits and signs live in one contiguous bytearray, one byte each
+PROG = slice(0, 2)     # M1, M2 (PROG/Major mode)
+VERB = slice(2, 4)     # V1, V2
+NOUN = slice(4, 6)     # N1, N2
+R1 = slice(6, 11)      # Register 1 (5 digits)
+R2 = slice(11, 16)     # Register 2 (5 digits)
+R3 = slice(16, 21)     # Register 3 (5 digits)
+SIGNS = slice(21, 24)  # R1, R2, R3 signs
+NUM_DIGITS = 21
+BUFFER_SIZE = 24
+
+# Digit value for a blank (unlit) digit
+BLANK = 0xFF
+
+# Sign values
+SIGN_PLUS = 0
+SIGN_MINUS = 1
+SIGN_NONE = 0xFF
+SIGN_CODES = {'+': SIGN_PLUS, '-': SIGN_MINUS, None: SIGN_NONE}
+
+
+def _digit_bytes(digits, count):
+    """
+    Convert digits to exactly count buffer bytes
+
+    None entries and missing trailing digits become BLANK, extra digits
+    are ignored. The length must match because the buffer has exported
+    memoryviews and can't be resized.
+    """
+    digits = [BLANK if digit is None else digit for digit in digits[:count]]
+    digits += [BLANK] * (count - len(digits))
+    return bytes(digits)
+
+
+class DisplayFrame(namedtuple('DisplayFrame', 'buffer comp_acty connected version')):
+    """
+    Immutable copy of the display state published by DisplayState
+
+    buffer is a bytes object with the layout described by PROG..SIGNS
+    """
+
+    __slots__ = ()
+
+    @property
+    def prog(self):
+        return self.buffer[PROG]
+
+    @property
+    def verb(self):
+        return self.buffer[VERB]
+
+    @property
+    def noun(self):
+        return self.buffer[NOUN]
+
+    @property
+    def r1(self):
+        return self.buffer[R1]
+
+    @property
+    def r2(self):
+        return self.buffer[R2]
+
+    @property
+    def r3(self):
+        return self.buffer[R3]
+
+    @property
+    def signs(self):
+        return self.buffer[SIGNS]
 
 
 class DisplayState:
-    """Manages the current state of all DSKY display elements"""
+    """
+    Manages the current state of all DSKY display elements
+
+    Writers update the working copy (buffer and the views into it,
+    comp_acty, connected) and then call mark_changed(), which publishes
+    it as a new DisplayFrame in self.frame. Replacing the attribute is
+    atomic, so the renderer reads self.frame without taking a lock.
+    Display data is written on the display thread (yaAGC packets are
+    decoded there); only the connection status is set from the yaAGC
+    communication thread.
+    """
 
     def __init__(self):
-        self.prog = [0, 0]  # M1, M2 (PROG/Major mode)
-        self.verb = [0, 0]  # V1, V2
-        self.noun = [0, 0]  # N1, N2
-        self.r1 = [0, 0, 0, 0, 0]  # Register 1 (5 digits)
-        self.r2 = [0, 0, 0, 0, 0]  # Register 2 (5 digits)
-        self.r3 = [0, 0, 0, 0, 0]  # Register 3 (5 digits)
-        self.r1_sign = None  # None, '+', or '-'
-        self.r2_sign = None
-        self.r3_sign = None
+        self.buffer = bytearray(BUFFER_SIZE)  # All digits and signs, see PROG..SIGNS
+        # Writable views into the buffer for each element
+        view = memoryview(self.buffer)
+        self.prog = view[PROG]
+        self.verb = view[VERB]
+        self.noun = view[NOUN]
+        self.r1 = view[R1]
+        self.r2 = view[R2]
+        self.r3 = view[R3]
+        self.signs = view[SIGNS]  # SIGN_PLUS, SIGN_MINUS or SIGN_NONE
+        self.signs[:] = bytes((SIGN_NONE, SIGN_NONE, SIGN_NONE))
         self.comp_acty = False  # Computer Activity indicator
         self.connected = True   # yaAGC connection status
-        self.lock = threading.Lock()  # Thread safety
+        self.frame = DisplayFrame(bytes(self.buffer), False, True, 0)  # Last published state
+        self._changed = threading.Condition()  # Serializes publishing, notified on change
+        self._woken = False  # Set by wake()
+
+    def mark_changed(self):
+        """
+        Publish the working copy as a new frame
+
+        Called by the setters, and by anything that writes the working
+        copy directly. Wakes up any thread blocked in wait_for_change().
+        """
+        with self._changed:
+            self.frame = DisplayFrame(bytes(self.buffer), self.comp_acty, self.connected,
+                                      self.frame.version + 1)
+            self._changed.notify_all()
+
+    def wake(self):
+        """Make wait_for_change() return early without changing the state"""
+        with self._changed:
+            self._woken = True
+            self._changed.notify_all()
+
+    def wait_for_change(self, version, timeout):
+        """
+        Block until the published frame version differs from version,
+        or until wake() is called
+
+        Args:
+            version: Last version the caller has seen
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the state changed or wake() was called, False on timeout
+        """
+        with self._changed:
+            woken = self._changed.wait_for(
+                lambda: self._woken or self.frame.version != version, timeout)
+            self._woken = False
+            return woken
 
     def set_prog(self, m1, m2):
-        """Set PROG display"""
-        with self.lock:
-            self.prog = [m1, m2]
+        """Set PROG display (None blanks a digit)"""
+        self.buffer[PROG] = _digit_bytes((m1, m2), 2)
+        self.mark_changed()
 
     def set_verb(self, v1, v2):
-        """Set VERB display"""
-        with self.lock:
-            self.verb = [v1, v2]
+        """Set VERB display (None blanks a digit)"""
+        self.buffer[VERB] = _digit_bytes((v1, v2), 2)
+        self.mark_changed()
 
     def set_noun(self, n1, n2):
-        """Set NOUN display"""
-        with self.lock:
-            self.noun = [n1, n2]
+        """Set NOUN display (None blanks a digit)"""
+        self.buffer[NOUN] = _digit_bytes((n1, n2), 2)
+        self.mark_changed()
 
     def set_register(self, reg_num, digits, sign=None):
-        """Set register display (reg_num: 1, 2, or 3)"""
-        with self.lock:
-            if reg_num == 1:
-                self.r1 = digits[:5]
-                if sign is not None:
-                    self.r1_sign = sign
-            elif reg_num == 2:
-                self.r2 = digits[:5]
-                if sign is not None:
-                    self.r2_sign = sign
-            elif reg_num == 3:
-                self.r3 = digits[:5]
-                if sign is not None:
-                    self.r3_sign = sign
-
-    def get_snapshot(self):
-        """Get thread-safe snapshot of current state"""
-        with self.lock:
-            return {
-                'prog': self.prog.copy(),
-                'verb': self.verb.copy(),
-                'noun': self.noun.copy(),
-                'r1': self.r1.copy(),
-                'r2': self.r2.copy(),
-                'r3': self.r3.copy(),
-                'r1_sign': self.r1_sign,
-                'r2_sign': self.r2_sign,
-                'r3_sign': self.r3_sign,
-                'comp_acty': self.comp_acty,
-                'connected': self.connected
-            }
+        """
+        Set register display
+
+        Args:
+            reg_num: 1, 2, or 3
+            digits: Up to 5 digits, None or missing digits are blank
+            sign: '+', '-' or None to leave the sign unchanged
+        """
+        if reg_num == 1:
+            self.buffer[R1] = _digit_bytes(digits, 5)
+        elif reg_num == 2:
+            self.buffer[R2] = _digit_bytes(digits, 5)
+        elif reg_num == 3:
+            self.buffer[R3] = _digit_bytes(digits, 5)
+        else:
+            return
+        if sign is not None:
+            self.signs[reg_num - 1] = SIGN_CODES[sign]
+        self.mark_changed()
+
+    def set_comp_acty(self, comp_acty):
+        """Set COMP ACTY indicator"""
+        self.comp_acty = comp_acty
+        self.mark_changed()
+
+    def set_connected(self, connected):
+        """Set yaAGC connection status"""
+        self.connected = connected
+        self.mark_changed()
 
 
 class DSKYDisplay:
     """Main DSKY display renderer using pygame"""
 
-    def __init__(self, config: Config):
+    def __init__(self, config):
         self.config = config
         self.state = DisplayState()
         self.running = False
@@ -105,8 +227,9 @@ class DSKYDisplay:
         self.fg_dim_color = hex_to_rgb(config.display.colors.foreground_dim)
         self.error_color = hex_to_rgb(config.display.colors.error_overlay)
 
-        # Load fonts
+        # Load fonts and pre-render glyphs
         self.fonts = self._load_fonts()
+        self.glyphs = self._render_glyphs()
 
         # Create clock for FPS management
         self.clock = pygame.time.Clock()
@@ -115,6 +238,88 @@ class DSKYDisplay:
         self.last_blink_time = time.time()
         self.blink_state = False
 
+        # State version shown on screen (-1 forces the next redraw)
+        self._rendered_version = -1
+
+        # State shown on screen, used to find the digits that changed
+        self._full_redraw = True
+        self._shown = bytearray(BUFFER_SIZE)
+        self._shown_comp_acty = False
+        self._dirty_rects = []
+
+        # Resolve hot config values into plain attributes
+        self._cache_layout()
+
+        # Static parts of the screen (ghost segments, COMP ACTY outline)
+        self.background = self._render_background()
+
+    def _cache_layout(self):
+        """
+        Copy the layout and other per-frame config values into plain
+        attributes, so the render methods don't walk the config tree
+        """
+        config = self.config
+        layout = config.layout
+
+        self._res = (config.display.resolution.width, config.display.resolution.height)
+        self._fps = config.display.fps
+        self._frame_time = 1.0 / self._fps
+
+        # Top-left position of every digit
+        self._prog_pos = self._digit_positions(layout.prog.x, layout.prog.y,
+                                               layout.prog.spacing + 40, 2)
+        self._verb_pos = self._digit_positions(layout.verb.x, layout.verb.y,
+                                               layout.verb.spacing + 40, 2)
+        self._noun_pos = self._digit_positions(layout.noun.x, layout.noun.y,
+                                               layout.noun.spacing + 40, 2)
+
+        # (sign position, digit positions) for R1, R2, R3
+        self._register_pos = []
+        for reg_layout in (layout.register_1, layout.register_2, layout.register_3):
+            self._register_pos.append((
+                (reg_layout.sign_x, reg_layout.sign_y),
+                self._digit_positions(reg_layout.x, reg_layout.y,
+                                      reg_layout.digit_spacing + 30, 5),
+            ))
+
+        # (x, y, font_key, rect) for every digit, in digit buffer order
+        self._digit_cells = []
+        groups = [(self._prog_pos, 'prog'), (self._verb_pos, 'verb_noun'),
+                  (self._noun_pos, 'verb_noun')]
+        groups += [(positions, 'register') for _, positions in self._register_pos]
+        for positions, font_key in groups:
+            ghost, digits = self.glyphs[font_key]
+            width = max(surface.get_width() for surface in [ghost] + digits)
+            height = max(surface.get_height() for surface in [ghost] + digits)
+            for x, y in positions:
+                self._digit_cells.append((x, y, font_key, pygame.Rect(x, y, width, height)))
+
+        # Position of the + and - (+ above -) and the area covered by each
+        # register's sign indicator
+        plus = self.glyphs['sign']['+'][0]
+        minus = self.glyphs['sign']['-'][0]
+        self._sign_pos = []
+        self._sign_rects = []
+        for (x, y), _ in self._register_pos:
+            plus_pos, minus_pos = (x, y - 20), (x, y + 5)
+            self._sign_pos.append((plus_pos, minus_pos))
+            self._sign_rects.append(plus.get_rect(topleft=plus_pos).union(
+                minus.get_rect(topleft=minus_pos)))
+
+        comp_acty = layout.comp_acty
+        self._comp_acty_rect = pygame.Rect(comp_acty.x, comp_acty.y,
+                                           comp_acty.width, comp_acty.height)
+
+        error_display = config.error_display
+        self._error_enabled = error_display.enabled
+        self._error_message = error_display.message
+        self._blink_rate = error_display.blink_rate
+
+    @staticmethod
+    def _digit_positions(x, y, step, count):
+        """Positions of count digits starting at (x, y), step pixels apart"""
+        return tuple((x + i * step, y) for i in range(count))
+
     def _load_fonts(self):
         """Load all required fonts - using system fonts for Pi compatibility"""
         fonts = {}
@@ -126,178 +331,229 @@ class DSKYDisplay:
         fonts['register'] = pygame.font.SysFont('monospace', self.config.display.font.size_register, bold=True)
         fonts['sign'] = pygame.font.SysFont('monospace', self.config.display.font.size_sign, bold=True)
         fonts['error'] = pygame.font.SysFont('monospace', self.config.error_display.font_size)
+        fonts['label'] = pygame.font.SysFont('monospace', 12)
 
         return fonts
 
-    def render_7segment_digit(self, digit, x, y, font):
+    def _render_glyphs(self):
         """
-        Render a 7-segment digit with authentic appearance
-        Shows ghost '8' in background, then actual digit on top
-        """
-        # Render background "8" (all segments) in dim color
-        ghost = font.render("8", True, self.fg_dim_color)
-        self.screen.blit(ghost, (x, y))
+        Pre-render every digit and sign glyph once
 
-        # Render actual digit in bright color
-        if digit is not None:
-            digit_surface = font.render(str(digit), True, self.fg_color)
-            self.screen.blit(digit_surface, (x, y))
+        Returns a dict keyed by font name. Digit fonts map to
+        (ghost, digits) where ghost is the dim '8' and digits[n] is the
+        bright surface for n. The 'sign' font maps '+'/'-' to
+        (bright, dim). Call again if fonts or colors change.
+        """
+        glyphs = {}
+        for font_key in ('prog', 'verb_noun', 'register'):
+            font = self.fonts[font_key]
+            ghost = font.render("8", True, self.fg_dim_color)
+            digits = [font.render(str(digit), True, self.fg_color) for digit in range(10)]
+            glyphs[font_key] = (ghost, digits)
 
-    def render_sign(self, sign, x, y):
-        """Render +/- sign indicator"""
         font = self.fonts['sign']
+        glyphs['sign'] = {
+            sign: (font.render(sign, True, self.fg_color),
+                   font.render(sign, True, self.fg_dim_color))
+            for sign in ('+', '-')
+        }
+        # Bright sign glyphs indexed by SIGN_PLUS / SIGN_MINUS
+        glyphs['sign_code'] = (glyphs['sign']['+'][0], glyphs['sign']['-'][0])
+
+        font = self.fonts['label']
+        glyphs['comp_acty'] = (font.render("COMP ACTY", True, self.fg_color),
+                               font.render("COMP ACTY", True, self.fg_dim_color))
+        return glyphs
+
+    def _render_background(self):
+        """
+        Render everything that doesn't depend on the display state: the
+        background color, the dim ghost '8' behind every digit, the dim
+        '+'/'-' of every sign and the dim COMP ACTY indicator
+        """
+        background = pygame.Surface(self._res).convert()
+        background.fill(self.bg_color)
 
-        # Render both + and - in dim color as background
-        ghost_plus = font.render("+", True, self.fg_dim_color)
-        ghost_minus = font.render("-", True, self.fg_dim_color)
+        for x, y, font_key, _ in self._digit_cells:
+            background.blit(self.glyphs[font_key][0], (x, y))
 
-        # Calculate positions (+ above -)
-        plus_y = y - 20
-        minus_y = y + 5
+        ghost_plus = self.glyphs['sign']['+'][1]
+        ghost_minus = self.glyphs['sign']['-'][1]
+        for plus_pos, minus_pos in self._sign_pos:
+            background.blit(ghost_plus, plus_pos)
+            background.blit(ghost_minus, minus_pos)
+
+        self._draw_comp_acty(background, self.fg_dim_color, self.glyphs['comp_acty'][1])
+        return background
+
+    def render_7segment_digit(self, digit, x, y, font_key):
+        """
+        Render a 7-segment digit with authentic appearance
+        The ghost '8' is part of the background, only the lit digit is drawn
+        """
+        if digit != BLANK:
+            self.screen.blit(self.glyphs[font_key][1][digit], (x, y))
 
-        self.screen.blit(ghost_plus, (x, plus_y))
-        self.screen.blit(ghost_minus, (x, minus_y))
+    def render_sign(self, sign, reg_index):
+        """
+        Render +/- sign indicator (the dim +/- are part of the background)
 
+        Args:
+            sign: SIGN_PLUS, SIGN_MINUS or SIGN_NONE
+            reg_index: 0, 1 or 2 for R1, R2, R3
+        """
         # Render active sign in bright color
-        if sign == '+':
-            sign_surface = font.render("+", True, self.fg_color)
-            self.screen.blit(sign_surface, (x, plus_y))
-        elif sign == '-':
-            sign_surface = font.render("-", True, self.fg_color)
-            self.screen.blit(sign_surface, (x, minus_y))
-
-    def render_prog(self, snapshot):
-        """Render PROG (Major Mode) display"""
-        layout = self.config.layout.prog
-        font = self.fonts['prog']
-        x = layout.x
-        spacing = layout.spacing
+        if sign != SIGN_NONE:
+            self.screen.blit(self.glyphs['sign_code'][sign], self._sign_pos[reg_index][sign])
 
-        for i, digit in enumerate(snapshot['prog']):
-            self.render_7segment_digit(digit, x + i * (spacing + 40), layout.y, font)
+    def render_prog(self, frame):
+        """Render PROG (Major Mode) display"""
+        for digit, (x, y) in zip(frame.prog, self._prog_pos):
+            self.render_7segment_digit(digit, x, y, 'prog')
 
-    def render_verb(self, snapshot):
+    def render_verb(self, frame):
         """Render VERB display"""
-        layout = self.config.layout.verb
-        font = self.fonts['verb_noun']
-        x = layout.x
-        spacing = layout.spacing
-
-        for i, digit in enumerate(snapshot['verb']):
-            self.render_7segment_digit(digit, x + i * (spacing + 40), layout.y, font)
+        for digit, (x, y) in zip(frame.verb, self._verb_pos):
+            self.render_7segment_digit(digit, x, y, 'verb_noun')
 
-    def render_noun(self, snapshot):
+    def render_noun(self, frame):
         """Render NOUN display"""
-        layout = self.config.layout.noun
-        font = self.fonts['verb_noun']
-        x = layout.x
-        spacing = layout.spacing
+        for digit, (x, y) in zip(frame.noun, self._noun_pos):
+            self.render_7segment_digit(digit, x, y, 'verb_noun')
 
-        for i, digit in enumerate(snapshot['noun']):
-            self.render_7segment_digit(digit, x + i * (spacing + 40), layout.y, font)
-
-    def render_register(self, reg_num, snapshot):
+    def render_register(self, reg_num, frame):
         """Render a register (R1, R2, or R3)"""
         if reg_num == 1:
-            layout = self.config.layout.register_1
-            digits = snapshot['r1']
-            sign = snapshot['r1_sign']
+            digits = frame.r1
         elif reg_num == 2:
-            layout = self.config.layout.register_2
-            digits = snapshot['r2']
-            sign = snapshot['r2_sign']
+            digits = frame.r2
         elif reg_num == 3:
-            layout = self.config.layout.register_3
-            digits = snapshot['r3']
-            sign = snapshot['r3_sign']
+            digits = frame.r3
         else:
             return
-
-        font = self.fonts['register']
-        x = layout.x
-        spacing = layout.digit_spacing
+        positions = self._register_pos[reg_num - 1][1]
 
         # Render sign indicator
-        self.render_sign(sign, layout.sign_x, layout.sign_y)
+        self.render_sign(frame.signs[reg_num - 1], reg_num - 1)
 
         # Render 5 digits
-        for i, digit in enumerate(digits):
-            self.render_7segment_digit(digit, x + i * (spacing + 30), layout.y, font)
+        for digit, (x, y) in zip(digits, positions):
+            self.render_7segment_digit(digit, x, y, 'register')
 
-    def render_comp_acty(self, snapshot):
-        """Render COMP ACTY indicator"""
-        layout = self.config.layout.comp_acty
+    def render_comp_acty(self, frame):
+        """Render COMP ACTY indicator (the dim version is part of the background)"""
+        if frame.comp_acty:
+            self._draw_comp_acty(self.screen, self.fg_color, self.glyphs['comp_acty'][0])
 
-        # Draw rectangle
-        if snapshot['comp_acty']:
-            color = self.fg_color
-        else:
-            color = self.fg_dim_color
-
-        pygame.draw.rect(self.screen, color,
-                        (layout.x, layout.y, layout.width, layout.height), 2)
-
-        # Draw label
-        font = pygame.font.SysFont('monospace', 12)
-        label = font.render("COMP ACTY", True, color)
-        label_rect = label.get_rect(center=(layout.x + layout.width // 2, layout.y + layout.height // 2))
-        self.screen.blit(label, label_rect)
+    def _draw_comp_acty(self, surface, color, label):
+        """Draw the COMP ACTY rectangle and label onto surface"""
+        rect = self._comp_acty_rect
+        pygame.draw.rect(surface, color, rect, 2)
+        surface.blit(label, label.get_rect(center=rect.center))
 
     def render_error_overlay(self):
         """Render error overlay when yaAGC connection is lost"""
-        if not self.config.error_display.enabled:
+        if not self._error_enabled:
             return
 
         # Create semi-transparent overlay
-        overlay = pygame.Surface((self.config.display.resolution.width,
-                                 self.config.display.resolution.height))
+        overlay = pygame.Surface(self._res)
         overlay.set_alpha(200)
         overlay.fill(self.error_color)
         self.screen.blit(overlay, (0, 0))
 
         # Blinking error message
         current_time = time.time()
-        if current_time - self.last_blink_time > self.config.error_display.blink_rate:
+        if current_time - self.last_blink_time > self._blink_rate:
             self.last_blink_time = current_time
             self.blink_state = not self.blink_state
 
         if self.blink_state:
             font = self.fonts['error']
-            text = font.render(self.config.error_display.message, True, (255, 255, 255))
-            rect = text.get_rect(center=(self.config.display.resolution.width // 2,
-                                        self.config.display.resolution.height // 2))
+            text = font.render(self._error_message, True, (255, 255, 255))
+            rect = text.get_rect(center=(self._res[0] // 2, self._res[1] // 2))
             self.screen.blit(text, rect)
 
     def render(self):
         """Main render method - draws all display elements"""
-        # Get thread-safe snapshot of current state
-        snapshot = self.state.get_snapshot()
+        # Latest published state (immutable, no lock needed)
+        frame = self.state.frame
 
-        # Clear screen with background color
-        self.screen.fill(self.bg_color)
+        # Nothing to redraw if the state is unchanged and no error
+        # overlay is blinking
+        if frame.version == self._rendered_version and frame.connected:
+            return
+        self._rendered_version = frame.version
+
+        if self._full_redraw or not frame.connected:
+            self.render_full(frame)
+            # Redraw everything once more after the overlay goes away
+            self._full_redraw = not frame.connected
+        else:
+            self.render_changes(frame)
+
+        # Remember what is on screen
+        self._shown[:] = frame.buffer
+        self._shown_comp_acty = frame.comp_acty
+
+    def render_full(self, frame):
+        """Draw the whole screen and flip it"""
+        # Clear screen to the static background
+        self.screen.blit(self.background, (0, 0))
 
         # Render all display elements
-        self.render_prog(snapshot)
-        self.render_verb(snapshot)
-        self.render_noun(snapshot)
-        self.render_register(1, snapshot)
-        self.render_register(2, snapshot)
-        self.render_register(3, snapshot)
-        self.render_comp_acty(snapshot)
+        self.render_prog(frame)
+        self.render_verb(frame)
+        self.render_noun(frame)
+        self.render_register(1, frame)
+        self.render_register(2, frame)
+        self.render_register(3, frame)
+        self.render_comp_acty(frame)
 
         # Render error overlay if not connected
-        if not snapshot['connected']:
+        if not frame.connected:
             self.render_error_overlay()
 
         # Update display
         pygame.display.flip()
 
-    def run(self, simulator=None):
+    def render_changes(self, frame):
+        """Redraw only the elements that changed and update their rects"""
+        dirty = self._dirty_rects
+        dirty.clear()
+
+        shown = self._shown
+        for i, value in enumerate(frame.buffer):
+            if value == shown[i]:
+                continue
+            if i < NUM_DIGITS:
+                x, y, font_key, rect = self._digit_cells[i]
+                self.screen.blit(self.background, rect, rect)
+                self.render_7segment_digit(value, x, y, font_key)
+            else:
+                reg_index = i - NUM_DIGITS
+                rect = self._sign_rects[reg_index]
+                self.screen.blit(self.background, rect, rect)
+                self.render_sign(value, reg_index)
+            dirty.append(rect)
+
+        if frame.comp_acty != self._shown_comp_acty:
+            rect = self._comp_acty_rect
+            self.screen.blit(self.background, rect, rect)
+            self.render_comp_acty(frame)
+            dirty.append(rect)
+
+        if dirty:
+            pygame.display.update(dirty)
+
+    def run(self, simulator=None, communicator=None):
         """
         Main display loop
 
         Args:
             simulator: Optional DSKYSimulator for simulation mode
+            communicator: Optional AGCCommunicator whose received packets
+                are decoded on this thread
         """
         self.running = True
 
@@ -306,17 +562,28 @@ class DSKYDisplay:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.VIDEOEXPOSE:
+                    # Window contents were lost, redraw on this frame
+                    self._rendered_version = -1
+                    self._full_redraw = True
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.running = False
                     elif simulator:
                         simulator.handle_keyboard(event)
 
+            # Apply the packets received from yaAGC since the last frame
+            if communicator:
+                communicator.apply_packets()
+
             # Render display
             self.render()
 
-            # Maintain target FPS
-            self.clock.tick(self.config.display.fps)
+            # Cap the frame rate, then sleep until the state changes. The
+            # wait times out after one frame so input is still polled and
+            # the error overlay keeps blinking.
+            self.clock.tick(self._fps)
+            self.state.wait_for_change(self._rendered_version, self._frame_time)
 
         # Cleanup
         pygame.quit()
@@ -337,7 +604,7 @@ if __name__ == '__main__':
         display.state.set_register(1, [1, 2, 3, 4, 5], '+')
         display.state.set_register(2, [9, 8, 7, 6, 5], '-')
         display.state.set_register(3, [0, 0, 0, 0, 0], None)
-        display.state.comp_acty = True
+        display.state.set_comp_acty(True)
 
         print("Starting display test...")
         print("Press ESC to exit")
@@ -5,19 +5,29 @@ Main entry point and application orchestration
 """
 
 import sys
-import argparse
 import threading
 import queue
 import socket
+import struct
 import time
+from types import SimpleNamespace
 from dsky_config import load_config
 from dsky_display import DSKYDisplay
 from dsky_simulator import DSKYSimulator
 from dsky_channel_decoder import decode_channel10, decode_channel11
 
 
-def parse_arguments():
-    """Parse command-line arguments"""
+# Kernel receive buffer size for the yaAGC socket
+RECV_BUFFER_SIZE = 64 * 1024
+
+# Reads one big-endian 4-byte packet word at an offset into a buffer
+_unpack_word = struct.Struct('>I').unpack_from
+
+
+def _build_parser():
+    """Build the argparse parser, only needed for --help and bad arguments"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Apollo DSKY Display System',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -35,7 +45,47 @@ Examples:
                         help='Run in simulation mode (no yaAGC connection)')
     parser.add_argument('--host', help='yaAGC host address (overrides config)')
     parser.add_argument('--port', type=int, help='yaAGC port (overrides config)')
-    return parser.parse_args()
+    return parser
+
+
+def parse_arguments(argv=None):
+    """
+    Parse command-line arguments
+
+    The few supported options are parsed by hand to keep startup fast.
+    Anything else (--help, unknown or malformed options) is handed to
+    argparse, which prints the usage or error message and exits.
+
+    Args:
+        argv: Argument list (default: sys.argv[1:])
+
+    Returns:
+        Namespace with config, simulate, host and port attributes
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = SimpleNamespace(config='config/dsky_config.yaml', simulate=False,
+                           host=None, port=None)
+    it = iter(argv)
+    try:
+        for arg in it:
+            if arg == '--simulate':
+                args.simulate = True
+            elif arg == '--config':
+                args.config = next(it)
+            elif arg == '--host':
+                args.host = next(it)
+            elif arg == '--port':
+                args.port = int(next(it))
+            else:
+                break
+        else:
+            return args
+    except (StopIteration, ValueError):
+        pass
+
+    return _build_parser().parse_args(argv)
 
 
 class AGCCommunicator:
@@ -44,20 +94,38 @@ class AGCCommunicator:
     Adapted from piPeripheral.py framework
     """
 
-    def __init__(self, config, display_state):
+    def __init__(self, config, display_state, verbose=False):
         self.config = config
         self.display_state = display_state
+        self.verbose = verbose  # Print every received packet (debug)
         self.host = config.communication.yaagc.host
         self.port = config.communication.yaagc.port
         self.timeout = config.communication.yaagc.timeout
         self.reconnect_interval = config.communication.yaagc.reconnect_interval
         self.reconnect_max_attempts = config.communication.yaagc.reconnect_max_attempts
-        self.pulse = config.communication.pulse_rate
 
         self.socket = None
-        self.running = False
+        self._stop = threading.Event()  # Set by stop()
         self.last_packet_time = time.time()
 
+        # Batches of received packet words, filled by the
+        # communication thread and decoded on the display thread
+        self.packets = queue.SimpleQueue()
+
+        # Decoder for each yaAGC output channel, called as handler(value, display_state)
+        # Channel 13 (additional indicators, Phase 2) and channel 163
+        # (flashing behavior, Phase 3) are not handled yet
+        self._channel_handlers = {
+            0o10: decode_channel10,  # Channel 10 - Display data
+            0o11: decode_channel11,  # Channel 11 - COMP ACTY and indicators
+        }
+
+        # Receive buffer, filled by one recv_into per read
+        # (any trailing partial packet is kept for the next read)
+        self._rxbuf = bytearray(4096)
+        self._rxview = memoryview(self._rxbuf)
+        self._rx_len = 0
+
     def connect(self):
         """Connect to yaAGC with retry logic"""
         attempts = 0
@@ -65,37 +133,58 @@ class AGCCommunicator:
 
         print(f"Connecting to yaAGC at {self.host}:{self.port}...")
 
-        while attempts < max_attempts:
+        while attempts < max_attempts and not self._stop.is_set():
+            # Set up a local socket, self.socket is only assigned once the
+            # connection is ready (stop() may clear it from another thread)
+            sock = None
             try:
-                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self.socket.settimeout(self.timeout)  # Set timeout for connection
-                self.socket.connect((self.host, self.port))
-                print("Connected to yaAGC!")
-
-                # Set to non-blocking after successful connection
-                self.socket.setblocking(0)
-
-                # Reset packet timer on successful connection
-                self.last_packet_time = time.time()
-
-                with self.display_state.lock:
-                    self.display_state.connected = True
-
-                return True
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                # Room for bursts of packets between reads (set before
+                # connecting so the advertised TCP window can use it)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECV_BUFFER_SIZE)
+                # Timeout for connecting and for reads. Reads block until
+                # data arrives (stop() wakes them with shutdown()), the
+                # timeout only bounds an idle read
+                sock.settimeout(self.timeout)
+                sock.connect((self.host, self.port))
+
+                # Don't delay our ACKs/writes behind Nagle, and let the
+                # kernel detect a yaAGC host that went away silently
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
 
             except socket.error as e:
+                if sock is not None:
+                    sock.close()
                 attempts += 1
                 print(f"Connection attempt {attempts} failed: {e}")
 
                 if attempts < max_attempts:
                     print(f"Retrying in {self.reconnect_interval} seconds...")
-                    time.sleep(self.reconnect_interval)
+                    if self._stop.wait(self.reconnect_interval):
+                        break
                 else:
                     print("Max connection attempts reached.")
                     break
+                continue
+
+            if self._stop.is_set():
+                # stop() was called while connecting
+                sock.close()
+                break
 
-        with self.display_state.lock:
-            self.display_state.connected = False
+            self.socket = sock
+            print("Connected to yaAGC!")
+
+            # Reset packet timer and receive buffer on successful connection
+            self.last_packet_time = time.time()
+            self._rx_len = 0
+
+            self.display_state.set_connected(True)
+
+            return True
+
+        self.display_state.set_connected(False)
 
         return False
 
@@ -108,109 +197,137 @@ class AGCCommunicator:
                 pass
             self.socket = None
 
-        with self.display_state.lock:
-            self.display_state.connected = False
+        self.display_state.set_connected(False)
 
-    def receive_packet(self):
+    def receive_packets(self, sock):
         """
-        Receive and parse a 4-byte packet from yaAGC
+        Read the data available from yaAGC (waiting for it if needed)
+        and parse the 4-byte packets
+
+        Args:
+            sock: Connected yaAGC socket
 
         Returns:
-            (channel, value) tuple or None if no packet available
+            List of valid packets as 32-bit words (possibly empty), or
+            None if the connection was closed
         """
-        packet_size = 4
-        input_buffer = bytearray(packet_size)
-        left_to_read = packet_size
-        view = memoryview(input_buffer)
-
-        # Try to read 4 bytes (non-blocking)
+        view = self._rxview
+        rx_len = self._rx_len
         try:
-            while left_to_read > 0:
-                num_bytes = self.socket.recv_into(view, left_to_read)
-                if num_bytes == 0:
-                    return None
-                view = view[num_bytes:]
-                left_to_read -= num_bytes
-
-            # Full packet received - parse it
-            # Sanity check
-            if (input_buffer[0] & 0xF0) != 0x00:
-                return None
-            if (input_buffer[1] & 0xC0) != 0x40:
-                return None
-            if (input_buffer[2] & 0xC0) != 0x80:
-                return None
-            if (input_buffer[3] & 0xC0) != 0xC0:
-                return None
-
-            # Parse channel and value
-            channel = (input_buffer[0] & 0x0F) << 3
-            channel |= (input_buffer[1] & 0x38) >> 3
-            value = (input_buffer[1] & 0x07) << 12
-            value |= (input_buffer[2] & 0x3F) << 6
-            value |= (input_buffer[3] & 0x3F)
-
-            self.last_packet_time = time.time()
-            return (channel, value)
-
+            # Usually no partial packet is pending and the whole
+            # buffer is read into without slicing a new view
+            num_bytes = sock.recv_into(view[rx_len:] if rx_len else view)
         except socket.timeout:
+            return []
+        except OSError as e:
+            if not self._stop.is_set():
+                print(f"Packet receive error: {e}")
             return None
-        except BlockingIOError:
-            return None
-        except Exception as e:
-            print(f"Packet receive error: {e}")
+        if num_bytes == 0:
             return None
 
+        # Locals for the per-packet loop
+        buf = self._rxbuf
+        unpack_word = _unpack_word
+        end = rx_len + num_bytes
+        packets = []
+        append = packets.append
+        i = 0
+        while end - i >= 4:
+            word, = unpack_word(buf, i)
+
+            # Sanity check (0000xxxx 01xxxxxx 10xxxxxx 11xxxxxx),
+            # skip a byte at a time to resynchronize
+            if (word & 0xF0C0C0C0) != 0x004080C0:
+                i += 1
+                continue
+
+            # Keep the word itself, channel and value are extracted when
+            # the packet is applied (no tuple per packet)
+            append(word)
+            i += 4
+
+        # Keep any partial packet at the start of the buffer
+        self._rx_len = end - i
+        buf[:self._rx_len] = buf[i:end]
+
+        if packets:
+            self.last_packet_time = time.time()
+        return packets
+
     def communication_loop(self):
         """Main communication loop running in background thread"""
-        self.running = True
+        stopping = self._stop.is_set
 
         # Connect to yaAGC
         if not self.connect():
             print("Failed to connect to yaAGC")
-            self.running = False
             return
 
-        # Main loop
-        while self.running:
-            # Try to receive packet
-            packet = self.receive_packet()
-            if packet:
-                channel, value = packet
-                self.process_packet(channel, value)
-
-            # Note: We don't check for timeout based on last packet time
-            # because yaAGC only sends packets when data changes.
-            # Connection errors are caught in receive_packet() instead.
+        # Bound methods used on every read
+        receive_packets = self.receive_packets
+        put = self.packets.put
+        wake = self.display_state.wake
 
-            # Small sleep to avoid busy-waiting
-            time.sleep(self.pulse)
+        # Main loop
+        while not stopping():
+            sock = self.socket
+            if sock is None:
+                break
+
+            # Wait for data and hand it to the display thread
+            packets = receive_packets(sock)
+            if packets:
+                put(packets)
+                wake()
+
+            elif packets is None:
+                if stopping():
+                    break
+                # Connection lost - show the error overlay and reconnect
+                print("Connection to yaAGC lost")
+                self.disconnect()
+                if not self.connect():
+                    print("Failed to reconnect to yaAGC")
+                    return
+
+    def apply_packets(self):
+        """Decode all queued packets, called from the display thread"""
+        packets = self.packets
+        process_packet = self.process_packet
+        while not packets.empty():
+            for word in packets.get():
+                # Parse channel and value
+                channel = ((word >> 24) & 0x0F) << 3 | ((word >> 19) & 0x07)
+                value = ((word >> 16) & 0x07) << 12 | ((word >> 8) & 0x3F) << 6 | (word & 0x3F)
+                process_packet(channel, value)
 
     def process_packet(self, channel, value):
         """Process received packet and update display state"""
         # Convert channel to octal for easier identification
         channel_octal = channel
 
-        # Debug: Print all received packets
-        print(f"Received: Channel {oct(channel_octal)} = {oct(value)} ({value})")
+        # Debug: Print all received packets (a stdout write on the
+        # display thread per packet, so only when verbose)
+        if self.verbose:
+            print(f"Received: Channel {oct(channel_octal)} = {oct(value)} ({value})")
 
-        if channel_octal == 0o10:  # Channel 10 - Display data
-            decode_channel10(value, self.display_state)
-
-        elif channel_octal == 0o11:  # Channel 11 - COMP ACTY and indicators
-            decode_channel11(value, self.display_state)
-
-        elif channel_octal == 0o13:  # Channel 13 - Additional indicators
-            # Phase 2 - LED indicators
-            pass
-
-        elif channel_octal == 0o163:  # Channel 163 - Flashing behavior
-            # Phase 3 - Dynamic behaviors
-            pass
+        handler = self._channel_handlers.get(channel_octal)
+        if handler:
+            handler(value, self.display_state)
 
     def stop(self):
         """Stop communication loop"""
-        self.running = False
+        self._stop.set()
+
+        # Wake a recv blocked in the communication thread right away
+        sock = self.socket
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
         self.disconnect()
 
 
@@ -218,25 +335,26 @@ def main():
     """Main application entry point"""
     args = parse_arguments()
 
-    # Load configuration
-    try:
-        config = load_config(args.config)
-        print(f"Loaded configuration from {args.config}")
-    except Exception as e:
-        print(f"Error loading configuration: {e}", file=sys.stderr)
-        sys.exit(1)
-
     # Override config with command-line arguments
+    overrides = {'display': {}, 'communication': {'yaagc': {}}}
     if args.simulate:
-        config._config['display']['simulation_mode'] = True
+        overrides['display']['simulation_mode'] = True
         print("Running in SIMULATION MODE")
     if args.host:
-        config._config['communication']['yaagc']['host'] = args.host
+        overrides['communication']['yaagc']['host'] = args.host
         print(f"Overriding yaAGC host: {args.host}")
     if args.port:
-        config._config['communication']['yaagc']['port'] = args.port
+        overrides['communication']['yaagc']['port'] = args.port
         print(f"Overriding yaAGC port: {args.port}")
 
+    # Load configuration
+    try:
+        config = load_config(args.config, overrides)
+        print(f"Loaded configuration from {args.config}")
+    except Exception as e:
+        print(f"Error loading configuration: {e}", file=sys.stderr)
+        sys.exit(1)
+
     # Initialize display
     try:
         display = DSKYDisplay(config)
@@ -256,7 +374,9 @@ def main():
 
     else:
         # Communication mode - connect to yaAGC
-        communicator = AGCCommunicator(config, display.state)
+        # DEBUG logging prints every packet received from yaAGC
+        communicator = AGCCommunicator(config, display.state,
+                                       verbose=config.logging.level == 'DEBUG')
 
         # Start communication thread
         comm_thread = threading.Thread(
@@ -268,11 +388,12 @@ def main():
 
         try:
             # Run display loop in main thread
-            display.run()
+            display.run(communicator=communicator)
         except KeyboardInterrupt:
             print("\nShutting down...")
         finally:
             communicator.stop()
+            comm_thread.join(communicator.timeout)
 
     print("DSKY Display System terminated.")
 
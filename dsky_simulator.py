@@ -5,16 +5,56 @@ Provides manual control for testing without yaAGC
 """
 
 import pygame
-from dsky_display import DisplayState
+from enum import IntEnum
+from functools import partial
+from dsky_display import DisplayState, SIGN_CODES, SIGN_PLUS, SIGN_MINUS, SIGN_NONE
+
+
+class Element(IntEnum):
+    """Display element selected for editing in the simulator"""
+    PROG = 0
+    VERB = 1
+    NOUN = 2
+    R1 = 3
+    R2 = 4
+    R3 = 5
+
+
+# Number of digits of each Element
+_MAX_DIGITS = (2, 2, 2, 5, 5, 5)
+
+
+def _pattern(prog, verb, noun, r1, r2, r3, signs):
+    """Build a display buffer image (see dsky_display.PROG..SIGNS)"""
+    return bytes(prog + verb + noun + r1 + r2 + r3 + signs)
+
+
+_ZEROS5 = (0, 0, 0, 0, 0)
+_EIGHTS5 = (8, 8, 8, 8, 8)
+
+# Display buffer contents of the test patterns, built once
+_PATTERN_BLANK = _pattern((0, 0), (0, 0), (0, 0), _ZEROS5, _ZEROS5, _ZEROS5,
+                          (SIGN_NONE, SIGN_NONE, SIGN_NONE))
+_PATTERN_ALL_EIGHTS = _pattern((8, 8), (8, 8), (8, 8), _EIGHTS5, _EIGHTS5, _EIGHTS5,
+                               (SIGN_PLUS, SIGN_MINUS, SIGN_PLUS))
+_PATTERN_TEST = _pattern((0, 0), (1, 6), (3, 6), _ZEROS5, _ZEROS5, _ZEROS5,
+                         (SIGN_PLUS, SIGN_PLUS, SIGN_PLUS))
+_PATTERN_COUNTING = _pattern((1, 2), (3, 4), (5, 6), (1, 2, 3, 4, 5), (6, 7, 8, 9, 0),
+                             (9, 8, 7, 6, 5), (SIGN_PLUS, SIGN_MINUS, SIGN_NONE))
 
 
 class DSKYSimulator:
     """Provides manual control for testing DSKY display without yaAGC"""
 
-    def __init__(self, display_state: DisplayState):
+    def __init__(self, display_state: DisplayState, verbose=False):
         self.state = display_state
-        self.selected_element = 'prog'  # prog, verb, noun, r1, r2, r3
+        self.verbose = verbose  # Print feedback for every key press (toggled by F12)
+        self.selected_element = Element.PROG
         self.selected_digit = 0  # Which digit in the selected element
+        # Writable view of each Element's digits, indexed by Element
+        self._banks = (display_state.prog, display_state.verb, display_state.noun,
+                       display_state.r1, display_state.r2, display_state.r3)
+        self._key_table = self._build_key_table()  # Key code -> action
 
         print("\n=== DSKY Simulation Mode ===")
         print("Keyboard Controls:")
@@ -31,6 +71,7 @@ class DSKYSimulator:
         print("  -:   Set negative sign on selected register")
         print("  C:   Toggle COMP ACTY")
         print("  E:   Toggle error display")
+        print("  F12: Toggle key feedback messages")
         print("  ESC: Exit")
         print("================================\n")
 
@@ -45,99 +86,101 @@ class DSKYSimulator:
 
         # Number keys 0-9
         if pygame.K_0 <= key <= pygame.K_9:
-            digit = key - pygame.K_0
-            self._set_digit(digit)
-
-        # Function keys for test patterns
-        elif key == pygame.K_F1:
-            self.pattern_blank()
-            print("Pattern: Blank")
-        elif key == pygame.K_F2:
-            self.pattern_all_eights()
-            print("Pattern: All eights (lamp test)")
-        elif key == pygame.K_F3:
-            self.pattern_test()
-            print("Pattern: Test (V16N36)")
-        elif key == pygame.K_F4:
-            self.pattern_counting()
-            print("Pattern: Counting")
-
-        # Element selection
-        elif key == pygame.K_p:
-            self.selected_element = 'prog'
-            self.selected_digit = 0
-            print(f"Selected: PROG digit {self.selected_digit}")
-        elif key == pygame.K_v:
-            self.selected_element = 'verb'
-            self.selected_digit = 0
-            print(f"Selected: VERB digit {self.selected_digit}")
-        elif key == pygame.K_n:
-            self.selected_element = 'noun'
-            self.selected_digit = 0
-            print(f"Selected: NOUN digit {self.selected_digit}")
-        elif key == pygame.K_r:
-            # Cycle through registers
-            if self.selected_element == 'r1':
-                self.selected_element = 'r2'
-            elif self.selected_element == 'r2':
-                self.selected_element = 'r3'
-            else:
-                self.selected_element = 'r1'
-            self.selected_digit = 0
-            print(f"Selected: {self.selected_element.upper()} digit {self.selected_digit}")
-
-        # Sign control
-        elif key == pygame.K_PLUS or key == pygame.K_EQUALS:  # + key
-            self._set_sign('+')
-        elif key == pygame.K_MINUS:  # - key
-            self._set_sign('-')
-
-        # COMP ACTY toggle
-        elif key == pygame.K_c:
-            with self.state.lock:
-                self.state.comp_acty = not self.state.comp_acty
-            print(f"COMP ACTY: {self.state.comp_acty}")
-
-        # Error display toggle (for testing)
-        elif key == pygame.K_e:
-            with self.state.lock:
-                self.state.connected = not self.state.connected
-            print(f"Connected: {self.state.connected}")
-
-        # Arrow keys to navigate digits
-        elif key == pygame.K_LEFT:
-            max_digits = self._get_max_digits()
-            self.selected_digit = (self.selected_digit - 1) % max_digits
-            print(f"Selected: {self.selected_element.upper()} digit {self.selected_digit}")
-        elif key == pygame.K_RIGHT:
-            max_digits = self._get_max_digits()
-            self.selected_digit = (self.selected_digit + 1) % max_digits
-            print(f"Selected: {self.selected_element.upper()} digit {self.selected_digit}")
+            self._set_digit(key - pygame.K_0)
+            return
+
+        action = self._key_table.get(key)
+        if action:
+            action()
+
+    def _build_key_table(self):
+        """Map pygame key codes to the simulator action they trigger"""
+        return {
+            # Function keys for test patterns
+            pygame.K_F1: partial(self._run_pattern, self.pattern_blank, "Blank"),
+            pygame.K_F2: partial(self._run_pattern, self.pattern_all_eights, "All eights (lamp test)"),
+            pygame.K_F3: partial(self._run_pattern, self.pattern_test, "Test (V16N36)"),
+            pygame.K_F4: partial(self._run_pattern, self.pattern_counting, "Counting"),
+
+            # Element selection
+            pygame.K_p: partial(self._select_element, Element.PROG),
+            pygame.K_v: partial(self._select_element, Element.VERB),
+            pygame.K_n: partial(self._select_element, Element.NOUN),
+            pygame.K_r: self._cycle_register,
+
+            # Sign control
+            pygame.K_PLUS: partial(self._set_sign, '+'),
+            pygame.K_EQUALS: partial(self._set_sign, '+'),  # + key without shift
+            pygame.K_MINUS: partial(self._set_sign, '-'),
+
+            # Indicator toggles (error display is for testing)
+            pygame.K_c: self._toggle_comp_acty,
+            pygame.K_e: self._toggle_connected,
+
+            # Arrow keys to navigate digits
+            pygame.K_LEFT: partial(self._move_digit, -1),
+            pygame.K_RIGHT: partial(self._move_digit, 1),
+
+            pygame.K_F12: self._toggle_verbose,
+        }
+
+    def _log(self, message):
+        """Print key press feedback if verbose (avoids a stdout write per key)"""
+        if self.verbose:
+            print(message)
+
+    def _toggle_verbose(self):
+        """Turn key press feedback on or off"""
+        self.verbose = not self.verbose
+        print(f"Key feedback: {'on' if self.verbose else 'off'}")
+
+    def _run_pattern(self, pattern, name):
+        """Show a test pattern"""
+        pattern()
+        self._log(f"Pattern: {name}")
+
+    def _select_element(self, element):
+        """Select PROG, VERB or NOUN"""
+        self.selected_element = element
+        self.selected_digit = 0
+        self._log(f"Selected: {element.name} digit {self.selected_digit}")
+
+    def _cycle_register(self):
+        """Select the next register (R1->R2->R3)"""
+        element = self.selected_element
+        if Element.R1 <= element < Element.R3:
+            self.selected_element = Element(element + 1)
+        else:
+            self.selected_element = Element.R1
+        self.selected_digit = 0
+        self._log(f"Selected: {self.selected_element.name} digit {self.selected_digit}")
+
+    def _toggle_comp_acty(self):
+        """Toggle the COMP ACTY indicator"""
+        self.state.set_comp_acty(not self.state.comp_acty)
+        self._log(f"COMP ACTY: {self.state.comp_acty}")
+
+    def _toggle_connected(self):
+        """Toggle the connection status to show or hide the error display"""
+        self.state.set_connected(not self.state.connected)
+        self._log(f"Connected: {self.state.connected}")
+
+    def _move_digit(self, step):
+        """Move the digit selection left (-1) or right (+1)"""
+        max_digits = self._get_max_digits()
+        self.selected_digit = (self.selected_digit + step) % max_digits
+        self._log(f"Selected: {self.selected_element.name} digit {self.selected_digit}")
 
     def _get_max_digits(self):
         """Get maximum number of digits for selected element"""
-        if self.selected_element in ['prog', 'verb', 'noun']:
-            return 2
-        else:  # registers
-            return 5
+        return _MAX_DIGITS[self.selected_element]
 
     def _set_digit(self, digit):
         """Set the currently selected digit to a value"""
-        with self.state.lock:
-            if self.selected_element == 'prog':
-                self.state.prog[self.selected_digit] = digit
-            elif self.selected_element == 'verb':
-                self.state.verb[self.selected_digit] = digit
-            elif self.selected_element == 'noun':
-                self.state.noun[self.selected_digit] = digit
-            elif self.selected_element == 'r1':
-                self.state.r1[self.selected_digit] = digit
-            elif self.selected_element == 'r2':
-                self.state.r2[self.selected_digit] = digit
-            elif self.selected_element == 'r3':
-                self.state.r3[self.selected_digit] = digit
-
-        print(f"Set {self.selected_element.upper()}[{self.selected_digit}] = {digit}")
+        self._banks[self.selected_element][self.selected_digit] = digit
+        self.state.mark_changed()
+
+        self._log(f"Set {self.selected_element.name}[{self.selected_digit}] = {digit}")
 
         # Auto-advance to next digit
         max_digits = self._get_max_digits()
@@ -145,75 +188,36 @@ class DSKYSimulator:
 
     def _set_sign(self, sign):
         """Set sign for currently selected register"""
-        if self.selected_element not in ['r1', 'r2', 'r3']:
-            print("Sign can only be set on registers (R1, R2, R3)")
+        if self.selected_element < Element.R1:
+            self._log("Sign can only be set on registers (R1, R2, R3)")
             return
 
-        with self.state.lock:
-            if self.selected_element == 'r1':
-                self.state.r1_sign = sign
-            elif self.selected_element == 'r2':
-                self.state.r2_sign = sign
-            elif self.selected_element == 'r3':
-                self.state.r3_sign = sign
+        self.state.signs[self.selected_element - Element.R1] = SIGN_CODES[sign]
+        self.state.mark_changed()
 
-        print(f"Set {self.selected_element.upper()} sign = {sign}")
+        self._log(f"Set {self.selected_element.name} sign = {sign}")
 
     def pattern_blank(self):
         """Blank all displays"""
-        with self.state.lock:
-            self.state.prog = [0, 0]
-            self.state.verb = [0, 0]
-            self.state.noun = [0, 0]
-            self.state.r1 = [0, 0, 0, 0, 0]
-            self.state.r2 = [0, 0, 0, 0, 0]
-            self.state.r3 = [0, 0, 0, 0, 0]
-            self.state.r1_sign = None
-            self.state.r2_sign = None
-            self.state.r3_sign = None
-            self.state.comp_acty = False
+        self._show(_PATTERN_BLANK, False)
 
     def pattern_all_eights(self):
         """Display 88888 in all registers (lamp test)"""
-        with self.state.lock:
-            self.state.prog = [8, 8]
-            self.state.verb = [8, 8]
-            self.state.noun = [8, 8]
-            self.state.r1 = [8, 8, 8, 8, 8]
-            self.state.r2 = [8, 8, 8, 8, 8]
-            self.state.r3 = [8, 8, 8, 8, 8]
-            self.state.r1_sign = '+'
-            self.state.r2_sign = '-'
-            self.state.r3_sign = '+'
-            self.state.comp_acty = True
+        self._show(_PATTERN_ALL_EIGHTS, True)
 
     def pattern_test(self):
         """Display test pattern: VERB 16 NOUN 36 (common AGC display)"""
-        with self.state.lock:
-            self.state.prog = [0, 0]
-            self.state.verb = [1, 6]
-            self.state.noun = [3, 6]
-            self.state.r1 = [0, 0, 0, 0, 0]
-            self.state.r2 = [0, 0, 0, 0, 0]
-            self.state.r3 = [0, 0, 0, 0, 0]
-            self.state.r1_sign = '+'
-            self.state.r2_sign = '+'
-            self.state.r3_sign = '+'
-            self.state.comp_acty = False
+        self._show(_PATTERN_TEST, False)
 
     def pattern_counting(self):
         """Display counting pattern"""
-        with self.state.lock:
-            self.state.prog = [1, 2]
-            self.state.verb = [3, 4]
-            self.state.noun = [5, 6]
-            self.state.r1 = [1, 2, 3, 4, 5]
-            self.state.r2 = [6, 7, 8, 9, 0]
-            self.state.r3 = [9, 8, 7, 6, 5]
-            self.state.r1_sign = '+'
-            self.state.r2_sign = '-'
-            self.state.r3_sign = None
-            self.state.comp_acty = True
+        self._show(_PATTERN_COUNTING, True)
+
+    def _show(self, pattern, comp_acty):
+        """Copy a precomputed pattern into the display buffer"""
+        self.state.buffer[:] = pattern
+        self.state.comp_acty = comp_acty
+        self.state.mark_changed()
 
 
 if __name__ == '__main__':
@@ -222,10 +226,9 @@ if __name__ == '__main__':
     from dsky_config import load_config
 
     try:
-        config = load_config('config/dsky_config.yaml')
-
         # Enable simulation mode
-        config._config['display']['simulation_mode'] = True
+        config = load_config('config/dsky_config.yaml',
+                             {'display': {'simulation_mode': True}})
 
         display = DSKYDisplay(config)
         simulator = DSKYSimulator(display.state)